@@ -3,6 +3,7 @@ from .limits import limiter
 from flask_limiter.util import get_remote_address
 from .database import create_tables
 from .routes import main_bp
+from .assets import init_assets
 import os
 import secrets
 import hmac
@@ -82,14 +83,20 @@ def create_app():
     # Make token generator available in templates
     app.jinja_env.globals["csrf_token"] = generate_csrf_token
 
+    # Fingerprinted static assets and the asset_url() template helper
+    init_assets(app)
+
     @app.before_request
     def csrf_protect():
         """CSRF protection for POST requests"""
         if request.method == "POST":
-            # Get token from form
-            form_token = request.form.get("csrf_token")
+            # Read the token from the header or query string only. Touching
+            # request.form here would make Werkzeug parse and spool the whole
+            # multipart body before we know whether to reject it; an unread
+            # body is discarded by the server without being parsed.
+            token = request.headers.get("X-CSRF-Token") or request.args.get("csrf_token")
             
-            if not validate_csrf_token(form_token):
+            if not validate_csrf_token(token):
                 abort(403, "CSRF token missing or invalid")
 
     # Ensure upload folder exists
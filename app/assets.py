@@ -0,0 +1,111 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+
+from flask import current_app, url_for
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip variants are always built
+    brotli = None
+
+
+def fingerprint_pattern(sources):
+    """Regex matching the hashed names build_assets() produces for sources."""
+    alternatives = []
+    for name in sources:
+        stem, ext = os.path.splitext(name)
+        alternatives.append(rf"{re.escape(stem)}\.[0-9a-f]{{12}}{re.escape(ext)}")
+    return re.compile(rf"^(?:{'|'.join(alternatives)})$")
+
+
+def build_assets(static_dir, dist_dir, sources, retention=0):
+    """Copy sources into dist_dir under content-hashed names with .gz/.br variants.
+
+    Returns the manifest mapping logical filenames to fingerprinted ones.
+    """
+    os.makedirs(dist_dir, exist_ok=True)
+    manifest_path = os.path.join(dist_dir, "manifest.json")
+    previous = load_manifest(dist_dir)
+    manifest = {}
+
+    for name in sources:
+        # Read once so the hash, the copy and the compressed variants all
+        # come from the same bytes even if the source changes mid-build
+        with open(os.path.join(static_dir, name), "rb") as fh:
+            data = fh.read()
+
+        stem, ext = os.path.splitext(name)
+        hashed_name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        dest = os.path.join(dist_dir, hashed_name)
+
+        with open(dest, "wb") as fh:
+            fh.write(data)
+        # mtime=0 keeps the gzip output byte-for-byte reproducible across builds
+        with open(dest + ".gz", "wb") as fh:
+            fh.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            with open(dest + ".br", "wb") as fh:
+                fh.write(brotli.compress(data, quality=11))
+
+        manifest[name] = hashed_name
+
+    with open(manifest_path, "w") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+
+    # Stamp files this build supersedes so retention counts from now, not
+    # from when they were first built
+    for hashed_name in set(previous.values()) - set(manifest.values()):
+        for suffix in ("", ".gz", ".br"):
+            path = os.path.join(dist_dir, hashed_name + suffix)
+            if os.path.exists(path):
+                os.utime(path)
+
+    _prune_stale(dist_dir, sources, manifest, retention)
+    return manifest
+
+
+def _prune_stale(dist_dir, sources, manifest, retention):
+    """Delete superseded hashed files once they are older than retention seconds.
+
+    Superseded files are kept for a while because pages rendered before the
+    build (running workers, open tabs, cached HTML) still reference them.
+    """
+    pattern = fingerprint_pattern(sources)
+    current = set(manifest.values())
+    cutoff = time.time() - retention
+
+    for filename in os.listdir(dist_dir):
+        base = re.sub(r"\.(gz|br)$", "", filename)
+        if base in current or not pattern.match(base):
+            continue
+        path = os.path.join(dist_dir, filename)
+        if os.path.getmtime(path) < cutoff:
+            os.remove(path)
+
+
+def load_manifest(dist_dir):
+    """Load the asset manifest, or an empty one if assets have not been built."""
+    try:
+        with open(os.path.join(dist_dir, "manifest.json")) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def asset_url(filename):
+    """Template helper: fingerprinted URL for a static asset, falling back to /static."""
+    hashed_name = current_app.extensions["assets"].get(filename)
+    if hashed_name is None:
+        return url_for("static", filename=filename)
+    return url_for("main.asset_file", filename=hashed_name)
+
+
+def init_assets(app):
+    """Load the manifest and expose asset_url() to templates."""
+    app.extensions["assets"] = load_manifest(app.config["ASSET_DIST_DIR"])
+    app.jinja_env.globals["asset_url"] = asset_url
+
@@ -0,0 +1,26 @@
+"""Build fingerprinted, precompressed static assets.
+
+Usage: python -m app.build_assets
+
+Reads its settings from Config and never creates the app, so it runs without
+a database (e.g. in CI or an image build).
+"""
+import os
+
+from .assets import build_assets
+from .config import Config
+
+
+def main():
+    manifest = build_assets(
+        os.path.join(os.path.dirname(__file__), "static"),
+        Config.ASSET_DIST_DIR,
+        Config.STATIC_ASSETS,
+        retention=Config.ASSET_RETENTION,
+    )
+    for name, hashed_name in sorted(manifest.items()):
+        print(f"{name} -> {hashed_name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,10 @@ class Config:
         )
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Embedded SQLite backend (DATABASE_URL=sqlite:///path/to/db): bytes of the
+    # database file to memory-map for reads; 0 disables mmap
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
     
     # Security settings
     SQLALCHEMY_ENGINE_OPTIONS = {
@@ -76,6 +80,13 @@ class Config:
         ".jpeg": "image/jpeg",
     }
 
+    # Static asset pipeline: `python -m app.build_assets` writes fingerprinted,
+    # precompressed copies of these files into ASSET_DIST_DIR
+    STATIC_ASSETS = ("mystyle.css", "myscript.js")
+    ASSET_DIST_DIR = os.path.join(BASE_DIR, "app", "static", "dist")
+    ASSET_MAX_AGE = 31536000  # 1 year; fingerprinted names never change content
+    ASSET_RETENTION = 7 * 24 * 3600  # keep superseded builds for a week
+
     # MySQL local dev helper (reference only):
     # CREATE USER 'spider1'@'localhost' IDENTIFIED BY 'whiskey';
     # GRANT ALL PRIVILEGES ON secure_app.* TO 'spider1'@'localhost';
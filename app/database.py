@@ -1,45 +1,173 @@
 import pymysql
 import pymysql.cursors
+import sqlite3
 from flask import current_app
 import os
 from contextlib import contextmanager
 
-def get_db_connection():
-    """Get database connection using environment variables or config"""
-    config = current_app.config
-    
-    # Try to get connection details from config
-    if hasattr(config, 'MYSQL_USER'):
-        user = config.MYSQL_USER
-        password = config.MYSQL_PASSWORD
-        host = config.MYSQL_HOST
-        port = config.MYSQL_PORT
-        database = config.MYSQL_DB
-    else:
-        # Fallback to environment variables
-        user = os.getenv("MYSQL_USER", "spider1")
-        password = os.getenv("MYSQL_PASSWORD", "whiskey")
-        host = os.getenv("MYSQL_HOST", "127.0.0.1")
-        port = int(os.getenv("MYSQL_PORT", "3306"))
-        database = os.getenv("MYSQL_DB", "secure_app")
-    
-    connection = pymysql.connect(
-        host=host,
-        user=user,
-        password=password,
-        database=database,
-        port=port,
-        charset='utf8mb4',
-        cursorclass=pymysql.cursors.DictCursor,
-        autocommit=False
+
+class MySQLBackend:
+    """PyMySQL backend; opens a fresh connection per operation."""
+
+    placeholder = "%s"
+
+    create_table_statements = (
+        """
+            CREATE TABLE IF NOT EXISTS entry (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                text TEXT,
+                image_filename VARCHAR(255)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+        """
+            CREATE TABLE IF NOT EXISTS comment (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                text TEXT NOT NULL
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """,
+    )
+
+    def __init__(self, database=None):
+        # Connection details come from environment variables; database
+        # overrides MYSQL_DB (used by the benchmark to target a scratch schema)
+        self.user = os.getenv("MYSQL_USER", "spider1")
+        self.password = os.getenv("MYSQL_PASSWORD", "whiskey")
+        self.host = os.getenv("MYSQL_HOST", "127.0.0.1")
+        self.port = int(os.getenv("MYSQL_PORT", "3306"))
+        self.database = database or os.getenv("MYSQL_DB", "secure_app")
+
+    def connect(self):
+        return pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            port=self.port,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=False
+        )
+
+    def release(self, connection):
+        connection.close()
+
+    def close(self):
+        pass
+
+
+def _dict_factory(cursor, row):
+    """Return rows as plain dicts, matching PyMySQL's DictCursor."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
+class SQLiteBackend:
+    """Embedded SQLite backend for single-node deployments.
+
+    Connections are kept in a small pool and handed to whichever thread needs
+    one, so sqlite3's per-connection prepared statement cache survives across
+    requests even when the server starts a thread per request.
+    """
+
+    placeholder = "?"
+
+    create_table_statements = (
+        """
+            CREATE TABLE IF NOT EXISTS entry (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT,
+                image_filename VARCHAR(255)
+            )
+        """,
+        """
+            CREATE TABLE IF NOT EXISTS comment (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL
+            )
+        """,
     )
-    
-    return connection
+
+    def __init__(self, path, mmap_size=0, pool_size=8):
+        self.path = path
+        self.mmap_size = int(mmap_size)
+        self.pool_size = pool_size
+        self._pool = []
+        self._pid = os.getpid()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def connect(self):
+        if self._pid != os.getpid():
+            # SQLite connections must not cross fork(); start a fresh pool in
+            # the child and keep a reference to the parent's connections so
+            # garbage collection never closes them from this process
+            self._inherited, self._pool = self._pool, []
+            self._pid = os.getpid()
+
+        try:
+            # list.pop/append are atomic, so no lock is needed to share the pool
+            return self._pool.pop()
+        except IndexError:
+            pass
+
+        # Each connection is used by one thread at a time via get_db_cursor
+        connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        connection.row_factory = _dict_factory
+        # WAL lets readers proceed while a writer commits; NORMAL sync is
+        # durable across application crashes in WAL mode
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        return connection
+
+    def release(self, connection):
+        if self._pid == os.getpid() and len(self._pool) < self.pool_size:
+            self._pool.append(connection)
+        else:
+            connection.close()
+
+    def close(self):
+        """Close all pooled connections."""
+        pool, self._pool = self._pool, []
+        for connection in pool:
+            connection.close()
+
+
+def create_backend(config):
+    """Build the storage backend: SQLite for sqlite:/// URLs, otherwise MySQL."""
+    database_url = config.get("DATABASE_URL") or ""
+
+    if database_url.startswith("sqlite:///"):
+        path = database_url[len("sqlite:///"):]
+        if not path or path == ":memory:":
+            # Every pooled connection would get its own empty database
+            raise ValueError("DATABASE_URL must point to a SQLite database file, e.g. sqlite:///instance/secure_app.db")
+        if not os.path.isabs(path):
+            path = os.path.join(config["BASE_DIR"], path)
+        return SQLiteBackend(path, mmap_size=config.get("SQLITE_MMAP_SIZE", 0))
+
+    # MySQL keeps using the MYSQL_* environment variables
+    return MySQLBackend()
+
+
+def get_backend():
+    """Get the storage backend for the current app, creating it on first use"""
+    backend = current_app.extensions.get("database")
+    if backend is None:
+        backend = current_app.extensions["database"] = create_backend(current_app.config)
+    return backend
+
+
+def get_db_connection():
+    """Get a database connection from the configured backend"""
+    return get_backend().connect()
 
 @contextmanager
 def get_db_cursor():
     """Context manager for database operations"""
-    connection = get_db_connection()
+    backend = get_backend()
+    connection = backend.connect()
+    cursor = None
     try:
         cursor = connection.cursor()
         yield cursor
@@ -48,46 +176,40 @@ def get_db_cursor():
         connection.rollback()
         raise e
     finally:
-        cursor.close()
-        connection.close()
+        if cursor is not None:
+            cursor.close()
+        backend.release(connection)
 
 def create_tables():
     """Create database tables if they don't exist"""
     with get_db_cursor() as cursor:
-        # Create Entry table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS entry (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                text TEXT,
-                image_filename VARCHAR(255)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-        """)
-        
-        # Create Comment table (if needed)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS comment (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                text TEXT NOT NULL
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-        """)
+        # Create Entry and Comment tables
+        for statement in get_backend().create_table_statements:
+            cursor.execute(statement)
+
+    # This runs at startup, before servers such as gunicorn --preload fork
+    # workers; don't leave connections behind for the children to inherit
+    get_backend().close()
 
 def insert_entry(text, image_filename):
     """Insert a new entry into the database"""
+    p = get_backend().placeholder
     with get_db_cursor() as cursor:
-        cursor.execute("""
-            INSERT INTO entry (text, image_filename) 
-            VALUES (%s, %s)
+        cursor.execute(f"""
+            INSERT INTO entry (text, image_filename)
+            VALUES ({p}, {p})
         """, (text, image_filename))
         return cursor.lastrowid
 
 def get_recent_entries(limit=100):
     """Get recent entries from database"""
+    p = get_backend().placeholder
     with get_db_cursor() as cursor:
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT id, text, image_filename
-            FROM entry 
-            ORDER BY id DESC 
-            LIMIT %s
+            FROM entry
+            ORDER BY id DESC
+            LIMIT {p}
         """, (limit,))
         return cursor.fetchall()
 
@@ -1,10 +1,12 @@
 import os, uuid
+import mimetypes
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, send_from_directory, session, abort
 from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 from PIL import Image, UnidentifiedImageError
 from .database import insert_entry, get_recent_entries, get_total_entries_count
 from .limits import limiter
+from .assets import fingerprint_pattern
 import secrets
 import re
 import threading
@@ -301,6 +303,34 @@ def uploaded_file(filename):
     return send_from_directory(current_app.config["UPLOAD_DIR"], filename)
 
 
+@main_bp.route("/assets/<filename>")
+def asset_file(filename):
+    """Serve fingerprinted static assets with immutable caching and precompressed bodies."""
+    # Any fingerprinted name is servable, not just the current manifest's, so
+    # pages rendered against an earlier build keep working
+    if not fingerprint_pattern(current_app.config["STATIC_ASSETS"]).match(filename):
+        abort(404)
+
+    dist_dir = current_app.config["ASSET_DIST_DIR"]
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    # Prefer brotli, then gzip, when the client accepts it and the variant was built
+    encoding, served_name = None, filename
+    for candidate, suffix in (("br", ".br"), ("gzip", ".gz")):
+        if request.accept_encodings[candidate] and os.path.exists(os.path.join(dist_dir, filename + suffix)):
+            encoding, served_name = candidate, filename + suffix
+            break
+
+    response = send_from_directory(
+        dist_dir, served_name, mimetype=mimetype, max_age=current_app.config["ASSET_MAX_AGE"]
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.immutable = True
+    return response
+
+
 @main_bp.app_errorhandler(RequestEntityTooLarge)
 def handle_request_entity_too_large(e):
     """Handle payloads over MAX_CONTENT_LENGTH with a redirect and a snarky note."""
@@ -0,0 +1,82 @@
+"""Compare the MySQL and SQLite storage backends on the read and write paths.
+
+Runs insert_entry, get_recent_entries(100) and get_total_entries_count
+against each backend. SQLite uses a throwaway database file. MySQL only runs
+when MYSQL_BENCH_DB names a scratch database (reached with the usual MYSQL_*
+credentials); it is never run against the app's own MYSQL_DB.
+
+Usage: MYSQL_BENCH_DB=secure_app_bench python benchmarks/database_backends.py [rounds]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from flask import Flask
+
+from app.database import (
+    MySQLBackend,
+    create_tables,
+    get_recent_entries,
+    get_total_entries_count,
+    insert_entry,
+)
+
+
+def make_app(database_url, backend=None):
+    app = Flask(__name__)
+    app.config.from_object("app.config.Config")
+    app.config["DATABASE_URL"] = database_url
+    if backend is not None:
+        app.extensions["database"] = backend
+    return app
+
+
+def timed(fn, rounds):
+    start = time.perf_counter()
+    for i in range(rounds):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    return rounds / elapsed, elapsed / rounds * 1e6
+
+
+def run(name, app, rounds):
+    with app.app_context():
+        try:
+            create_tables()
+        except Exception as e:
+            print(f"{name:<8} skipped ({e})")
+            return
+
+        results = [
+            ("insert_entry", timed(lambda i: insert_entry(f"benchmark entry {i}", None), rounds)),
+            ("get_recent_entries", timed(lambda i: get_recent_entries(100), rounds)),
+            ("get_total_entries_count", timed(lambda i: get_total_entries_count(), rounds)),
+        ]
+
+    for operation, (ops, us) in results:
+        print(f"{name:<8} {operation:<25} {ops:>10.0f} {us:>10.1f}")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print(f"{rounds} rounds per operation\n")
+    print(f"{'backend':<8} {'operation':<25} {'ops/s':>10} {'us/op':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run("sqlite", make_app(f"sqlite:///{os.path.join(tmp, 'bench.db')}"), rounds)
+
+    bench_db = os.getenv("MYSQL_BENCH_DB")
+    if not bench_db:
+        print(f"{'mysql':<8} skipped (set MYSQL_BENCH_DB to a scratch database)")
+    elif bench_db == os.getenv("MYSQL_DB", "secure_app"):
+        print(f"{'mysql':<8} skipped (MYSQL_BENCH_DB must differ from MYSQL_DB)")
+    else:
+        run("mysql", make_app(None, MySQLBackend(database=bench_db)), rounds)
+
+
+if __name__ == "__main__":
+    main()